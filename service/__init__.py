@@ -6,12 +6,16 @@ and SQL database
 """
 import sys
 from flask import Flask
+from flask_compress import Compress
 from service import config
-from service.common import log_handlers
+from service.common import log_handlers, json_handlers
+from service.common.cache import cache
 
 # Create Flask application
 app = Flask(__name__)
 app.config.from_object(config)
+json_handlers.init_json(app)
+compress = Compress(app)
 
 # Import the routes After the Flask app is created
 # pylint: disable=wrong-import-position, cyclic-import, wrong-import-order
@@ -23,6 +27,9 @@ from service.common import error_handlers, cli_commands  # noqa: F401 E402
 # Set up logging for production
 log_handlers.init_logging(app, "gunicorn.error")
 
+# Set up the response cache
+cache.init_app(app)
+
 app.logger.info(70 * "*")
 app.logger.info("  A C C O U N T   S E R V I C E   R U N N I N G  ".center(70, "*"))
 app.logger.info(70 * "*")
@@ -0,0 +1,113 @@
+"""
+Response Cache
+
+This module contains a cache-aside store for serialized JSON responses,
+held in process memory and in Redis when they are configured
+"""
+import logging
+import threading
+import redis
+from cachetools import TTLCache
+
+logger = logging.getLogger("flask.app")
+
+ALL_ACCOUNTS_KEY = "accounts:all"
+
+# Value kept in Redis for a while after a key is invalidated
+TOMBSTONE = b"\x00invalidated"
+
+
+def account_key(account_id):
+    """Returns the cache key of a single Account"""
+    return f"account:{account_id}"
+
+
+class ResponseCache:
+    """Stores JSON response bodies in process memory and in Redis"""
+
+    def __init__(self):
+        self.client = None
+        self.local = None
+        self.lock = threading.Lock()  # TTLCache is not thread safe
+        self.ttl = 60
+        self.hold = 5
+
+    def init_app(self, app):
+        """Sets up the cache tiers configured for the app"""
+        self.ttl = app.config.get("CACHE_TTL", self.ttl)
+        self.hold = app.config.get("CACHE_INVALIDATION_HOLD", self.hold)
+        local_size = app.config.get("LOCAL_CACHE_SIZE", 0)
+        if local_size:
+            self.local = TTLCache(
+                maxsize=local_size, ttl=app.config.get("LOCAL_CACHE_TTL", 30)
+            )
+            logger.info("Local response cache established")
+        redis_url = app.config.get("REDIS_URL")
+        if not redis_url:
+            logger.info("Redis response cache disabled: REDIS_URL is not set")
+            return
+        self.client = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=app.config.get("REDIS_SOCKET_TIMEOUT", 0.1),
+            socket_connect_timeout=app.config.get("REDIS_CONNECT_TIMEOUT", 0.1),
+        )
+        logger.info("Redis response cache established")
+
+    def get(self, key):
+        """Returns the cached body for key, or None on a miss"""
+        if self.local is not None:
+            with self.lock:
+                body = self.local.get(key)
+            if body is not None:
+                return body
+        if self.client is None:
+            return None
+        try:
+            body = self.client.get(key)
+        except redis.RedisError as error:
+            logger.warning("Cache lookup failed: %s", error)
+            return None
+        if body == TOMBSTONE:
+            return None
+        if body is not None and self.local is not None:
+            with self.lock:
+                self.local[key] = body
+        return body
+
+    def set(self, key, body):
+        """
+        Caches body under key for the configured TTL, unless the key was
+        invalidated within the hold time
+        """
+        if self.local is not None:
+            with self.lock:
+                self.local[key] = body
+        if self.client is None:
+            return
+        try:
+            self.client.set(key, body, ex=self.ttl, nx=True)
+        except redis.RedisError as error:
+            logger.warning("Cache store failed: %s", error)
+
+    def invalidate(self, *keys):
+        """Removes keys from the cache and holds them off for a while"""
+        # A reader that loaded the old row before this write could store it
+        # after we delete the key. The tombstone blocks that store, since set()
+        # uses SET NX, for CACHE_INVALIDATION_HOLD seconds; the local tier has
+        # no tombstones and stays bounded by LOCAL_CACHE_TTL
+        if self.local is not None:
+            with self.lock:
+                for key in keys:
+                    self.local.pop(key, None)
+        if self.client is None:
+            return
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.set(key, TOMBSTONE, ex=self.hold)
+            pipeline.execute()
+        except redis.RedisError as error:
+            logger.warning("Cache invalidation failed: %s", error)
+
+
+cache = ResponseCache()
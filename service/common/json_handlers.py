@@ -0,0 +1,35 @@
+"""
+JSON Handlers
+
+This module contains utility functions to swap the stdlib json
+module used by jsonify() and request.get_json() for orjson
+"""
+import orjson
+from flask.json import JSONDecoder, JSONEncoder
+
+
+class OrjsonEncoder(JSONEncoder):
+    """JSON encoder that serializes with orjson"""
+
+    def encode(self, o):
+        """Return a JSON string representation of the object"""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(o, default=self.default, option=option).decode("utf-8")
+
+
+class OrjsonDecoder(JSONDecoder):
+    """JSON decoder that deserializes with orjson"""
+
+    def decode(self, s, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Return the Python representation of the JSON document"""
+        return orjson.loads(s)
+
+
+def init_json(app):
+    """Set up orjson as the JSON encoder and decoder of the app"""
+    app.json_encoder = OrjsonEncoder
+    app.json_decoder = OrjsonDecoder
@@ -19,5 +19,25 @@ if not DATABASE_URI:
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# Configure the Redis response cache (disabled when REDIS_URL is not set)
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "60"))
+# Seconds an invalidated key refuses stores from requests that raced the write
+CACHE_INVALIDATION_HOLD = int(os.getenv("CACHE_INVALIDATION_HOLD", "5"))
+# Short Redis timeouts so an unreachable server falls back to the database
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.1"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "0.1"))
+
+# Configure the in-process response cache (disabled when LOCAL_CACHE_SIZE is 0)
+LOCAL_CACHE_SIZE = int(os.getenv("LOCAL_CACHE_SIZE", "0"))
+LOCAL_CACHE_TTL = int(os.getenv("LOCAL_CACHE_TTL", "30"))  # only the local worker is invalidated
+
+# Configure response compression (Flask-Compress)
+# Only the routes decorated with compress.compressed() are compressed, since
+# compression rewrites the ETag that read_an_account checks for 304 answers
+COMPRESS_REGISTER = False
+COMPRESS_MIMETYPES = ["application/json"]
+COMPRESS_ALGORITHM = ["br", "gzip"]
+
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "s3cr3t-key-shhhh")
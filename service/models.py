@@ -5,7 +5,10 @@ All of the models are stored in this module
 """
 import logging
 from datetime import date
+from typing import Optional
+import msgspec
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import delete, select, update
 
 logger = logging.getLogger("flask.app")
 
@@ -53,6 +56,48 @@ class PersistentBase:
         db.session.delete(self)
         db.session.commit()
 
+    def update_by_id(self, by_id):
+        """
+        Updates the record with the given ID to the values of this one
+        with a single UPDATE ... RETURNING statement
+
+        Returns this object loaded with the stored values, or None if
+        no record has that ID
+        """
+        logger.info("Updating %s with id %s", self.name, by_id)
+        table = self.__table__
+        values = {
+            column.name: getattr(self, column.name)
+            for column in table.columns
+            if not column.primary_key
+        }
+        stmt = (
+            update(table)
+            .where(table.c.id == by_id)
+            .values(values)
+            .returning(*table.columns)
+        )
+        row = db.session.execute(stmt).first()
+        db.session.commit()
+        if row is None:
+            return None
+        for key, value in row._asdict().items():
+            setattr(self, key, value)
+        return self
+
+    @classmethod
+    def delete_by_id(cls, by_id):
+        """
+        Removes the record with the given ID with a single DELETE statement
+
+        Returns True if a record was removed
+        """
+        logger.info("Deleting id %s", by_id)
+        table = cls.__table__
+        result = db.session.execute(delete(table).where(table.c.id == by_id))
+        db.session.commit()
+        return result.rowcount > 0
+
     @classmethod
     def init_db(cls, app):
         """Initializes the database session"""
@@ -71,9 +116,27 @@ class PersistentBase:
 
     @classmethod
     def find(cls, by_id):
-        """Finds a record by it's ID"""
+        """Finds a record by it's ID, checking the identity map first"""
         logger.info("Processing lookup for id %s ...", by_id)
-        return cls.query.get(by_id)
+        return db.session.get(cls, by_id)
+
+
+######################################################################
+#  A C C O U N T   J S O N   S C H E M A
+######################################################################
+class AccountSchema(msgspec.Struct):  # pylint: disable=too-few-public-methods
+    """Static JSON shape of an Account, encoded without a dictionary"""
+
+    id: int
+    name: Optional[str]
+    email: Optional[str]
+    address: Optional[str]
+    phone_number: Optional[str]
+    date_joined: date
+
+
+# sorted keys, like jsonify() with JSON_SORT_KEYS, so both account routes emit the same bytes
+_account_encoder = msgspec.json.Encoder(order="sorted")
 
 
 ######################################################################
@@ -108,6 +171,23 @@ class Account(db.Model, PersistentBase):
             "date_joined": self.date_joined.isoformat()
         }
 
+    @classmethod
+    def encode_all(cls):
+        """
+        Encodes all of the Accounts as a JSON array straight from the
+        column tuples, without building an ORM object or a dictionary
+        for each of them
+
+        The array holds the same bytes jsonify() writes for each serialize() result
+        """
+        logger.info("Processing all records")
+        stmt = select(
+            cls.id, cls.name, cls.email, cls.address, cls.phone_number, cls.date_joined
+        )
+        return _account_encoder.encode(
+            [AccountSchema(*row) for row in db.session.execute(stmt)]
+        )
+
     def deserialize(self, data):
         """
         Deserializes a Account from a dictionary
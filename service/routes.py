@@ -4,11 +4,15 @@ Account Service
 This microservice handles the lifecycle of Accounts
 """
 # pylint: disable=unused-import
-from flask import jsonify, request, make_response, abort, url_for   # noqa; F401
-import logging
+from flask import jsonify, request, abort, url_for   # noqa; F401
 from service.models import Account
 from service.common import status  # HTTP Status Codes
-from . import app  # Import Flask application
+from service.common.cache import cache, account_key, ALL_ACCOUNTS_KEY
+from . import app, compress  # Import Flask application
+
+# Static response bodies, serialized once at import
+HEALTH_BODY = b'{"status":"OK"}'
+INDEX_BODY = b'{"name":"Account REST API Service","version":"1.0"}'
 
 
 ############################################################
@@ -17,7 +21,7 @@ from . import app  # Import Flask application
 @app.route("/health")
 def health():
     """Health Status"""
-    return jsonify(dict(status="OK")), status.HTTP_200_OK
+    return json_response(HEALTH_BODY, status.HTTP_200_OK)
 
 
 ######################################################################
@@ -26,14 +30,8 @@ def health():
 @app.route("/")
 def index():
     """Root URL response"""
-    return (
-        jsonify(
-            name="Account REST API Service",
-            version="1.0",
-            # paths=url_for("list_accounts", _external=True),
-        ),
-        status.HTTP_200_OK,
-    )
+    # paths=url_for("list_accounts", _external=True) once it is implemented
+    return json_response(INDEX_BODY, status.HTTP_200_OK)
 
 
 ######################################################################
@@ -50,13 +48,12 @@ def create_accounts():
     account = Account()
     account.deserialize(request.get_json())
     account.create()
+    cache.invalidate(ALL_ACCOUNTS_KEY)
     message = account.serialize()
     # Uncomment once get_accounts has been implemented
     # location_url = url_for("get_accounts", account_id=account.id, _external=True)
     location_url = "/"  # Remove once get_accounts has been implemented
-    return make_response(
-        jsonify(message), status.HTTP_201_CREATED, {"Location": location_url}
-    )
+    return message, status.HTTP_201_CREATED, {"Location": location_url}
 
 ######################################################################
 # LIST ALL ACCOUNTS
@@ -64,28 +61,19 @@ def create_accounts():
 
 
 @app.route("/accounts", methods=["GET"])
+@compress.compressed()
 def list_all_account():
     """
     List all the account
     """
     app.logger.info("Request to list all the Accounts")
-    accounts = Account()
-    list = accounts.all()
-
-    # Converte ogni oggetto in un dizionario
-    result = []
-    for account in list:
-        result.append({
-           "id": account.id,
-           "name": account.name,
-           "email": account.email,
-           "address": account.address,
-           "phone_number": account.phone_number,
-           "date_joined": account.date_joined.isoformat()
-        })
+    cached = cache.get(ALL_ACCOUNTS_KEY)
+    if cached:
+        return json_response(cached, status.HTTP_200_OK)
 
-    # Restituisce la lista in formato JSON
-    return jsonify(result), status.HTTP_200_OK
+    body = Account.encode_all()
+    cache.set(ALL_ACCOUNTS_KEY, body)
+    return json_response(body, status.HTTP_200_OK)
 
 
 ######################################################################
@@ -98,30 +86,21 @@ def read_an_account(id):
     Read an Account
     This endpoint will read an Account based on the path param id
     """
-    logging.info(f"VALORE ID ROUTES {id}")
+    app.logger.debug("VALORE ID ROUTES %s", id)
 
-    account = Account()
-    found = account.find(id)
-
-    if (not found):
-        abort(status.HTTP_404_NOT_FOUND, f"Account with id [{id}] could not be found.")
-
-    message = found.serialize()
-    return make_response(
-        jsonify(message), status.HTTP_200_OK
-    )
-
-    # return account.serialize(), status.HTTP_200_OK
-    # Questa è una forma semplificata che Flask supporta.
-    # Qui Flask capisce che:
+    cached = cache.get(account_key(id))
+    if cached:
+        response = json_response(cached, status.HTTP_200_OK)
+    else:
+        found = Account.find(id) or abort(
+            status.HTTP_404_NOT_FOUND, f"Account with id [{id}] could not be found."
+        )
+        response = jsonify(found.serialize())
+        cache.set(account_key(id), response.get_data())
 
-    # Il primo elemento è il corpo della risposta,
-    # Il secondo è lo status code.
-    # Ma attenzione:
-    # Flask non applica automaticamente jsonify.
-    # Se account.serialize() è un dizionario, Flask lo convertirà in JSON solo se la @app.route
-    # o la Blueprint è gestita da un @app.route(..., jsonify=True) (solo in Flask ≥ 2.2).
-    # Altrimenti, il contenuto sarà convertito in stringa Python, non JSON vero e proprio.
+    # answer 304 Not Modified without a body if the client copy is current
+    response.add_etag()
+    return response.make_conditional(request)
 
 ######################################################################
 # UPDATE AN EXISTING ACCOUNT
@@ -137,23 +116,15 @@ def update_an_account(id):
     app.logger.info("Request to update an Account")
     check_content_type("application/json")
 
-    logging.info(f"VALORE ID ROUTES DA AGGIORNARE {id}")
+    app.logger.debug("VALORE ID ROUTES DA AGGIORNARE %s", id)
 
     account = Account()
-    found = account.find(id)
-
-    if (found):
-        account.deserialize(request.get_json())
-        account.update()
-        message = account.serialize()
-        return make_response(
-            jsonify(message), status.HTTP_200_OK
-        )
-    else:
-        # l’oggetto con un certo ID non è presente nel database.
-        return make_response(
-            "Not Found", status.HTTP_404_NOT_FOUND
-        )
+    account.deserialize(request.get_json())
+    found = account.update_by_id(id) or abort(
+        status.HTTP_404_NOT_FOUND, f"Account with id [{id}] could not be found."
+    )
+    cache.invalidate(account_key(id), ALL_ACCOUNTS_KEY)
+    return found.serialize(), status.HTTP_200_OK
 
 ######################################################################
 # DELETE AN ACCOUNT
@@ -163,20 +134,15 @@ def update_an_account(id):
 @app.route("/accounts/<int:id>", methods=["DELETE"])
 def delete_an_account(id):
     """
-    Read an Account
-    This endpoint will read an Account based on the path param id
+    Delete an Account
+    This endpoint will delete an Account based on the path param id
     """
-    logging.info(f"VALORE ID ROUTES DA CANCELLARE {id}")
+    app.logger.debug("VALORE ID ROUTES DA CANCELLARE %s", id)
 
-    account = Account()
-    found = account.find(id)
-
-    if (found):
-        found.delete()
-        return make_response("", status.HTTP_204_NO_CONTENT)
-    else:
-        return make_response(
-            "Not Found", status.HTTP_404_NOT_FOUND)
+    if not Account.delete_by_id(id):
+        abort(status.HTTP_404_NOT_FOUND, f"Account with id [{id}] could not be found.")
+    cache.invalidate(account_key(id), ALL_ACCOUNTS_KEY)
+    return "", status.HTTP_204_NO_CONTENT
 
 
 ######################################################################
@@ -184,12 +150,16 @@ def delete_an_account(id):
 ######################################################################
 
 
+def json_response(body, status_code):
+    """Builds a response from an already serialized JSON body"""
+    return app.response_class(body, status=status_code, mimetype="application/json")
+
+
 def check_content_type(media_type):
     """Checks that the media type is correct"""
-    content_type = request.headers.get("Content-Type")
-    if content_type and content_type == media_type:
+    if request.mimetype == media_type:
         return
-    app.logger.error("Invalid Content-Type: %s", content_type)
+    app.logger.error("Invalid Content-Type: %s", request.content_type)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         f"Content-Type must be {media_type}",
@@ -0,0 +1,154 @@
+"""
+Test cases for the Response Cache
+"""
+from unittest import TestCase
+from unittest.mock import MagicMock
+import redis
+from service.common.cache import ResponseCache, account_key, TOMBSTONE
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the cache uses"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        """Returns the value of key"""
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):  # pylint: disable=unused-argument
+        """Sets key, only if it does not exist when nx is True"""
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def pipeline(self, transaction=True):  # pylint: disable=unused-argument
+        """Runs the pipelined commands right away"""
+        return self
+
+    def execute(self):
+        """Completes the pipeline"""
+        return []
+
+
+class TestResponseCache(TestCase):
+    """Response Cache Tests"""
+
+    def setUp(self):
+        self.cache = ResponseCache()
+        self.cache.client = MagicMock()
+
+    def test_account_key(self):
+        """It should build the key of an Account"""
+        self.assertEqual(account_key(7), "account:7")
+
+    def test_disabled_without_redis_url(self):
+        """It should miss every lookup when REDIS_URL is not set"""
+        app = MagicMock()
+        app.config = {"CACHE_TTL": 30}
+        cache = ResponseCache()
+        cache.init_app(app)
+        self.assertIsNone(cache.client)
+        self.assertIsNone(cache.local)
+        self.assertEqual(cache.ttl, 30)
+        self.assertIsNone(cache.get("account:1"))
+        cache.set("account:1", b"{}")
+        self.assertIsNone(cache.get("account:1"))
+        cache.invalidate("account:1")
+        self.assertIsNone(cache.get("account:1"))
+
+    def test_init_with_redis_url(self):
+        """It should connect to the configured Redis server"""
+        app = MagicMock()
+        app.config = {"REDIS_URL": "redis://localhost:6379/0"}
+        cache = ResponseCache()
+        cache.init_app(app)
+        self.assertIsInstance(cache.client, redis.Redis)
+
+    def test_init_with_redis_timeouts(self):
+        """It should connect to Redis with the configured socket timeouts"""
+        app = MagicMock()
+        app.config = {
+            "REDIS_URL": "redis://localhost:6379/0",
+            "REDIS_SOCKET_TIMEOUT": 0.25,
+            "REDIS_CONNECT_TIMEOUT": 0.5,
+        }
+        cache = ResponseCache()
+        cache.init_app(app)
+        connection_kwargs = cache.client.connection_pool.connection_kwargs
+        self.assertEqual(connection_kwargs["socket_timeout"], 0.25)
+        self.assertEqual(connection_kwargs["socket_connect_timeout"], 0.5)
+
+    def test_init_with_default_redis_timeouts(self):
+        """It should never build a Redis client without socket timeouts"""
+        app = MagicMock()
+        app.config = {"REDIS_URL": "redis://localhost:6379/0"}
+        cache = ResponseCache()
+        cache.init_app(app)
+        connection_kwargs = cache.client.connection_pool.connection_kwargs
+        self.assertEqual(connection_kwargs["socket_timeout"], 0.1)
+        self.assertEqual(connection_kwargs["socket_connect_timeout"], 0.1)
+
+    def test_get_set_invalidate(self):
+        """It should read, store and invalidate bodies in Redis"""
+        self.cache.client.get.return_value = b"{}"
+        self.assertEqual(self.cache.get("account:1"), b"{}")
+        self.cache.set("account:1", b"{}")
+        self.cache.client.set.assert_called_once_with("account:1", b"{}", ex=60, nx=True)
+        self.cache.invalidate("account:1", "accounts:all")
+        pipeline = self.cache.client.pipeline.return_value
+        pipeline.set.assert_any_call("account:1", TOMBSTONE, ex=5)
+        pipeline.set.assert_any_call("accounts:all", TOMBSTONE, ex=5)
+        pipeline.execute.assert_called_once_with()
+
+    def test_tombstone_is_a_miss(self):
+        """It should treat an invalidated key as a miss"""
+        self.cache.client.get.return_value = TOMBSTONE
+        self.assertIsNone(self.cache.get("account:1"))
+
+    def test_stale_store_after_invalidate(self):
+        """It should not store a body read before a concurrent invalidation"""
+        self.cache.client = FakeRedis()
+        self.cache.set("account:1", b'{"name":"old"}')
+        # a reader misses the cache and loads the old row from the database
+        # then a writer commits and invalidates the key before the reader stores
+        self.cache.invalidate("account:1")
+        self.cache.set("account:1", b'{"name":"old"}')
+        self.assertIsNone(self.cache.get("account:1"))
+
+    def test_redis_errors_are_ignored(self):
+        """It should fall back to the database when Redis fails"""
+        self.cache.client.get.side_effect = redis.ConnectionError("down")
+        self.cache.client.set.side_effect = redis.ConnectionError("down")
+        self.cache.client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        with self.assertLogs("flask.app", "WARNING") as logs:
+            self.assertIsNone(self.cache.get("account:1"))
+            self.cache.set("account:1", b"{}")
+            self.cache.invalidate("account:1")
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn("Cache lookup failed: down", logs.output[0])
+        self.assertIn("Cache store failed: down", logs.output[1])
+        self.assertIn("Cache invalidation failed: down", logs.output[2])
+
+    def test_local_cache(self):
+        """It should serve bodies from process memory before Redis"""
+        app = MagicMock()
+        app.config = {"LOCAL_CACHE_SIZE": 8, "LOCAL_CACHE_TTL": 30}
+        cache = ResponseCache()
+        cache.init_app(app)
+        self.assertIsNotNone(cache.local)
+        self.assertIsNone(cache.get("account:1"))
+        cache.set("account:1", b"{}")
+        self.assertEqual(cache.get("account:1"), b"{}")
+        cache.invalidate("account:1")
+        self.assertIsNone(cache.get("account:1"))
+
+    def test_local_cache_filled_from_redis(self):
+        """It should keep Redis hits in process memory"""
+        self.cache.local = {}
+        self.cache.client.get.return_value = b"{}"
+        self.assertEqual(self.cache.get("account:1"), b"{}")
+        self.assertEqual(self.cache.get("account:1"), b"{}")
+        self.cache.client.get.assert_called_once_with("account:1")
@@ -10,9 +10,10 @@ Test cases can be run with the following:
 import os
 import logging
 from unittest import TestCase
+from sqlalchemy import text
 from tests.factories import AccountFactory
 from service.common import status  # HTTP Status Codes
-from service.models import db, Account, init_db
+from service.models import db, init_db
 from service.routes import app
 
 DATABASE_URI = os.getenv(
@@ -39,17 +40,18 @@ class TestAccountService(TestCase):
         logging.basicConfig(level=logging.INFO)
         init_db(app)
 
+        cls.client = app.test_client()
+
     @classmethod
     def tearDownClass(cls):
         """Runs once before test suite"""
 
     def setUp(self):
         """Runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
+        # clean up the last tests
+        db.session.execute(text("TRUNCATE account RESTART IDENTITY CASCADE"))
         db.session.commit()
 
-        self.client = app.test_client()
-
     def tearDown(self):
         """Runs once after each test case"""
         db.session.remove()
@@ -60,18 +62,14 @@ class TestAccountService(TestCase):
 
     def _create_accounts(self, count):
         """Factory method to create accounts in bulk"""
-        accounts = []
-        for _ in range(count):
-            account = AccountFactory()
-            response = self.client.post(BASE_URL, json=account.serialize())
-            self.assertEqual(
-                response.status_code,
-                status.HTTP_201_CREATED,
-                "Could not create test Account",
-            )
-            new_account = response.get_json()
-            account.id = new_account["id"]
-            accounts.append(account)
+        accounts = AccountFactory.create_batch(count)
+        for account in accounts:
+            account.id = None  # id must be none to generate next primary key
+        db.session.add_all(accounts)
+        db.session.flush()
+        # keep the loaded attributes so the tests do not reload each account
+        db.session.expunge_all()
+        db.session.commit()
         return accounts
 
     ######################################################################
@@ -93,6 +91,11 @@ class TestAccountService(TestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
 
+    def test_missing_media_type(self):
+        """It should not Create an Account when no media type is sent"""
+        response = self.client.post(BASE_URL, data="{}")
+        self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
     def test_read_account_not_found(self):
         """If no account found It should return HTTP_404_NOT_FOUND"""
         # try to read
@@ -0,0 +1,61 @@
+"""
+Test cases for the orjson JSON Handlers
+"""
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+import orjson
+from flask import jsonify
+from service import app
+from service.common import status  # HTTP Status Codes
+from service.common.json_handlers import OrjsonDecoder, OrjsonEncoder
+
+
+class TestJsonHandlers(TestCase):
+    """orjson JSON Handlers Tests"""
+
+    def setUp(self):
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self):
+        self.context.pop()
+
+    def test_app_uses_orjson(self):
+        """It should encode and decode with orjson"""
+        self.assertIs(app.json_encoder, OrjsonEncoder)
+        self.assertIs(app.json_decoder, OrjsonDecoder)
+        with patch("service.common.json_handlers.orjson.dumps", wraps=orjson.dumps) as dumps:
+            jsonify(status="OK")
+        dumps.assert_called_once()
+
+    def test_sorted_keys(self):
+        """It should sort the keys as JSON_SORT_KEYS asks"""
+        self.assertEqual(jsonify(b=1, a=2).get_data(), b'{"a":2,"b":1}\n')
+
+    def test_indented_output(self):
+        """It should indent the output when pretty printing is enabled"""
+        with patch.dict(app.config, {"JSONIFY_PRETTYPRINT_REGULAR": True}):
+            data = jsonify(a=[1]).get_data()
+        self.assertEqual(data, b'{\n  "a": [\n    1\n  ]\n}\n')
+
+    def test_dates_are_iso_format(self):
+        """It should encode dates in ISO 8601 instead of HTTP date format"""
+        self.assertEqual(jsonify(d=date(2020, 1, 2)).get_data(), b'{"d":"2020-01-02"}\n')
+
+    def test_non_ascii_is_not_escaped(self):
+        """It should write non-ASCII characters as UTF-8 whatever JSON_AS_ASCII says"""
+        self.assertEqual(jsonify(name="é").get_data(), '{"name":"é"}\n'.encode("utf-8"))
+
+    def test_flask_default_types(self):
+        """It should fall back to the Flask encoder for types orjson does not know"""
+        self.assertEqual(jsonify(price=Decimal("1.5")).get_data(), b'{"price":"1.5"}\n')
+
+    def test_malformed_json_is_bad_request(self):
+        """It should answer 400 Bad Request to malformed JSON"""
+        client = app.test_client()
+        response = client.post(
+            "/accounts", data="{not json", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -5,6 +5,8 @@ Test cases for Account Model
 import logging
 import unittest
 import os
+import orjson
+from sqlalchemy import text
 from service import app
 from service.models import Account, DataValidationError, db
 from tests.factories import AccountFactory
@@ -35,7 +37,8 @@ class TestAccount(unittest.TestCase):
 
     def setUp(self):
         """This runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
+        # clean up the last tests
+        db.session.execute(text("TRUNCATE account RESTART IDENTITY CASCADE"))
         db.session.commit()
 
     def tearDown(self):
@@ -107,6 +110,26 @@ class TestAccount(unittest.TestCase):
         account = Account.find(account.id)
         self.assertEqual(account.email, "XYZZY@plugh.com")
 
+    def test_update_account_by_id(self):
+        """It should Update an account by id in a single statement"""
+        account = AccountFactory()
+        account.create()
+
+        changes = AccountFactory()
+        updated = changes.update_by_id(account.id)
+        self.assertIs(updated, changes)
+        self.assertEqual(updated.id, account.id)
+
+        # Fetch it back
+        found_account = Account.find(account.id)
+        self.assertEqual(found_account.name, changes.name)
+        self.assertEqual(found_account.email, changes.email)
+
+    def test_update_account_by_id_not_found(self):
+        """It should not Update an account that does not exist"""
+        account = AccountFactory()
+        self.assertIsNone(account.update_by_id(0))
+
     def test_delete_an_account(self):
         """It should Delete an account from the database"""
         accounts = Account.all()
@@ -122,6 +145,16 @@ class TestAccount(unittest.TestCase):
         accounts = Account.all()
         self.assertEqual(len(accounts), 0)
 
+    def test_delete_account_by_id(self):
+        """It should Delete an account by id in a single statement"""
+        account = AccountFactory()
+        account.create()
+        account_id = account.id
+        self.assertEqual(len(Account.all()), 1)
+        self.assertTrue(Account.delete_by_id(account_id))
+        self.assertEqual(len(Account.all()), 0)
+        self.assertFalse(Account.delete_by_id(account_id))
+
     def test_list_all_accounts(self):
         """It should List all Accounts in the database"""
         accounts = Account.all()
@@ -132,6 +165,14 @@ class TestAccount(unittest.TestCase):
         accounts = Account.all()
         self.assertEqual(len(accounts), 5)
 
+    def test_encode_all_accounts(self):
+        """It should Encode all Accounts in the database as JSON"""
+        self.assertEqual(Account.encode_all(), b"[]")
+        account = AccountFactory()
+        account.create()
+        serial_accounts = orjson.loads(Account.encode_all())
+        self.assertEqual(serial_accounts, [account.serialize()])
+
     def test_find_by_name(self):
         """It should Find an Account by name"""
         account = AccountFactory()
@@ -8,9 +8,14 @@ Test cases can be run with the following:
 import os
 import logging
 from unittest import TestCase
+from unittest.mock import call, patch
+import gzip
+import orjson
+from sqlalchemy import text
 from tests.factories import AccountFactory
 from service.common import status  # HTTP Status Codes
-from service.models import db, Account, init_db
+from service.common.cache import cache, TOMBSTONE
+from service.models import db, init_db
 from service.routes import app
 
 DATABASE_URI = os.getenv(
@@ -20,6 +25,11 @@ DATABASE_URI = os.getenv(
 BASE_URL = "/accounts"
 
 
+def _json(response):
+    """Decodes the JSON body of a test client response"""
+    return orjson.loads(response.data)
+
+
 ######################################################################
 #  T E S T   C A S E S
 ######################################################################
@@ -37,17 +47,18 @@ class TestAccountService(TestCase):
         logging.basicConfig(level=logging.INFO)
         init_db(app)
 
+        cls.client = app.test_client()
+
     @classmethod
     def tearDownClass(cls):
         """Runs once before test suite"""
 
     def setUp(self):
         """Runs before each test"""
-        db.session.query(Account).delete()  # clean up the last tests
+        # clean up the last tests
+        db.session.execute(text("TRUNCATE account RESTART IDENTITY CASCADE"))
         db.session.commit()
 
-        self.client = app.test_client()
-
     def tearDown(self):
         """Runs once after each test case"""
         db.session.remove()
@@ -58,18 +69,14 @@ class TestAccountService(TestCase):
 
     def _create_accounts(self, count):
         """Factory method to create accounts in bulk"""
-        accounts = []
-        for _ in range(count):
-            account = AccountFactory()
-            response = self.client.post(BASE_URL, json=account.serialize())
-            self.assertEqual(
-                response.status_code,
-                status.HTTP_201_CREATED,
-                "Could not create test Account",
-            )
-            new_account = response.get_json()
-            account.id = new_account["id"]
-            accounts.append(account)
+        accounts = AccountFactory.create_batch(count)
+        for account in accounts:
+            account.id = None  # id must be none to generate next primary key
+        db.session.add_all(accounts)
+        db.session.flush()
+        # keep the loaded attributes so the tests do not reload each account
+        db.session.expunge_all()
+        db.session.commit()
         return accounts
 
     ######################################################################
@@ -80,12 +87,16 @@ class TestAccountService(TestCase):
         """It should get 200_OK from the Home Page"""
         response = self.client.get("/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content_type, "application/json")
+        data = _json(response)
+        self.assertEqual(data["name"], "Account REST API Service")
+        self.assertEqual(data["version"], "1.0")
 
     def test_health(self):
         """It should be healthy"""
         resp = self.client.get("/health")
         self.assertEqual(resp.status_code, 200)
-        data = resp.get_json()
+        data = _json(resp)
         self.assertEqual(data["status"], "OK")
 
     def test_create_account(self):
@@ -103,13 +114,23 @@ class TestAccountService(TestCase):
         self.assertIsNotNone(location)
 
         # Check the data is correct
-        new_account = response.get_json()
+        new_account = _json(response)
         self.assertEqual(new_account["name"], account.name)
         self.assertEqual(new_account["email"], account.email)
         self.assertEqual(new_account["address"], account.address)
         self.assertEqual(new_account["phone_number"], account.phone_number)
         self.assertEqual(new_account["date_joined"], str(account.date_joined))
 
+    def test_create_account_with_charset(self):
+        """It should Create an Account when the media type has a charset"""
+        account = AccountFactory()
+        response = self.client.post(
+            BASE_URL,
+            json=account.serialize(),
+            content_type="application/json; charset=utf-8"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     def test_read_account(self):
         """It should read the account"""
         # create an account
@@ -120,7 +141,7 @@ class TestAccountService(TestCase):
         response = self.client.get(f"{BASE_URL}/{account.id}", content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        new_account = account.deserialize(response.get_json())
+        new_account = account.deserialize(_json(response))
 
         logging.info(f"Test read_an_account - Account creato {account.name}")
         logging.info(f"Test read_an_account - Account letto {new_account.name}")
@@ -134,6 +155,143 @@ class TestAccountService(TestCase):
             and account.date_joined == new_account.date_joined
         )
 
+    def test_read_account_not_modified(self):
+        """It should return 304 when the client has the current account"""
+        account = self._create_accounts(1)[0]
+        response = self.client.get(f"{BASE_URL}/{account.id}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+
+        response = self.client.get(
+            f"{BASE_URL}/{account.id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.get_data(), b"")
+
+        # change the account and the ETag must change with it
+        response = self.client.put(
+            f"{BASE_URL}/{account.id}",
+            json=AccountFactory().serialize(),
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(
+            f"{BASE_URL}/{account.id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers.get("ETag"), etag)
+
+    def test_read_large_account_not_modified_with_compression(self):
+        """It should return 304 for a large account when the client accepts compression"""
+        account = AccountFactory(
+            name="n" * 64, email="e" * 64, address="a" * 256, phone_number="p" * 32
+        )
+        account.create()
+        headers = {"Accept-Encoding": "br, gzip"}
+        response = self.client.get(f"{BASE_URL}/{account.id}", headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreaterEqual(len(response.data), 500)
+        self.assertIsNone(response.headers.get("Content-Encoding"))
+        etag = response.headers.get("ETag")
+
+        headers["If-None-Match"] = etag
+        response = self.client.get(f"{BASE_URL}/{account.id}", headers=headers)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_read_account_from_cache(self):
+        """It should read the account from the cache when it is there"""
+        with patch.object(cache, "client") as client:
+            client.get.return_value = b'{"id": 1, "name": "cached"}'
+            response = self.client.get(f"{BASE_URL}/1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content_type, "application/json")
+        self.assertEqual(_json(response)["name"], "cached")
+        client.get.assert_called_once_with("account:1")
+
+    def test_read_account_stored_in_cache(self):
+        """It should store the account in the cache on a miss"""
+        account = self._create_accounts(1)[0]
+        with patch.object(cache, "client") as client:
+            client.get.return_value = None
+            response = self.client.get(f"{BASE_URL}/{account.id}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        client.set.assert_called_once_with(
+            f"account:{account.id}", response.get_data(), ex=cache.ttl, nx=True
+        )
+
+    def test_list_all_account_from_cache(self):
+        """It should list the accounts from the cache when they are there"""
+        with patch.object(cache, "client") as client:
+            client.get.return_value = b'[{"id": 1, "name": "cached"}]'
+            response = self.client.get(BASE_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content_type, "application/json")
+        self.assertEqual(_json(response), [{"id": 1, "name": "cached"}])
+        client.get.assert_called_once_with("accounts:all")
+
+    def test_list_all_account_stored_in_cache(self):
+        """It should store the account list in the cache on a miss"""
+        self._create_accounts(2)
+        with patch.object(cache, "client") as client:
+            client.get.return_value = None
+            response = self.client.get(BASE_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(_json(response)), 2)
+        client.set.assert_called_once_with(
+            "accounts:all", response.get_data(), ex=cache.ttl, nx=True
+        )
+
+    def test_create_account_invalidates_cache(self):
+        """It should invalidate the cached account list on create"""
+        with patch.object(cache, "client") as client:
+            response = self.client.post(BASE_URL, json=AccountFactory().serialize())
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        pipeline = client.pipeline.return_value
+        pipeline.set.assert_called_once_with("accounts:all", TOMBSTONE, ex=cache.hold)
+        pipeline.execute.assert_called_once_with()
+
+    def test_update_account_invalidates_cache(self):
+        """It should invalidate the cached account and list on update"""
+        account = self._create_accounts(1)[0]
+        with patch.object(cache, "client") as client:
+            response = self.client.put(
+                f"{BASE_URL}/{account.id}", json=AccountFactory().serialize()
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        pipeline = client.pipeline.return_value
+        pipeline.set.assert_has_calls([
+            call(f"account:{account.id}", TOMBSTONE, ex=cache.hold),
+            call("accounts:all", TOMBSTONE, ex=cache.hold),
+        ])
+        self.assertEqual(pipeline.set.call_count, 2)
+        pipeline.execute.assert_called_once_with()
+
+    def test_delete_account_invalidates_cache(self):
+        """It should invalidate the cached account and list on delete"""
+        account = self._create_accounts(1)[0]
+        with patch.object(cache, "client") as client:
+            response = self.client.delete(f"{BASE_URL}/{account.id}")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        pipeline = client.pipeline.return_value
+        pipeline.set.assert_has_calls([
+            call(f"account:{account.id}", TOMBSTONE, ex=cache.hold),
+            call("accounts:all", TOMBSTONE, ex=cache.hold),
+        ])
+        self.assertEqual(pipeline.set.call_count, 2)
+        pipeline.execute.assert_called_once_with()
+
+    def test_not_found_writes_keep_cache(self):
+        """It should not invalidate the cache when the account does not exist"""
+        with patch.object(cache, "client") as client:
+            response = self.client.put(
+                f"{BASE_URL}/0", json=AccountFactory().serialize()
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            response = self.client.delete(f"{BASE_URL}/0")
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        client.pipeline.assert_not_called()
+
     def test_list_all_account(self):
         """It should list all the accounts created"""
         # create 10 account
@@ -143,10 +301,33 @@ class TestAccountService(TestCase):
         response = self.client.get(BASE_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        account_list = response.get_json()
+        account_list = _json(response)
         logging.info(f"Lunghezza lista {len(account_list)}")
         self.assertTrue(len(account_list) >= 10)
 
+    def test_list_all_account_matches_serialize(self):
+        """It should list the accounts in the same shape as serialize()"""
+        account = self._create_accounts(1)[0]
+        response = self.client.get(BASE_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(_json(response), [account.serialize()])
+
+    def test_list_all_account_same_bytes_as_read(self):
+        """It should encode each listed account with the same bytes as a read"""
+        account = self._create_accounts(1)[0]
+        read = self.client.get(f"{BASE_URL}/{account.id}").get_data()
+        listed = self.client.get(BASE_URL).get_data()
+        self.assertEqual(listed, b"[" + read.rstrip(b"\n") + b"]")
+
+    def test_list_all_account_compressed(self):
+        """It should compress the account list when the client accepts it"""
+        self._create_accounts(10)
+        response = self.client.get(BASE_URL, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+        account_list = orjson.loads(gzip.decompress(response.data))
+        self.assertEqual(len(account_list), 10)
+
     def test_update_account(self):
         """It should Update an Account"""
         account = AccountFactory()
@@ -160,7 +341,7 @@ class TestAccountService(TestCase):
         # Overwrite the account with new data
         # And give it the id of the first account created
         account = AccountFactory()
-        account.id = response.get_json()["id"]
+        account.id = _json(response)["id"]
 
         response = self.client.put(
             f"{BASE_URL}/{account.id}",
@@ -169,7 +350,7 @@ class TestAccountService(TestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Check the data is correct
-        new_account = response.get_json()
+        new_account = _json(response)
         logging.info(new_account)
         self.assertEqual(new_account["name"], account.name)
         self.assertEqual(new_account["email"], account.email)
@@ -177,6 +358,11 @@ class TestAccountService(TestCase):
         self.assertEqual(new_account["phone_number"], account.phone_number)
         self.assertEqual(new_account["date_joined"], str(account.date_joined))
 
+        # Make sure the update was stored
+        response = self.client.get(f"{BASE_URL}/{account.id}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(_json(response)["name"], account.name)
+
     def test_delete_account(self):
         """It should Delete an Account"""
         accounts = self._create_accounts(1)
@@ -188,6 +374,10 @@ class TestAccountService(TestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
+        # Make sure it is gone
+        response = self.client.get(f"{BASE_URL}/{id}")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_delete_account_not_exists(self):
         """It should return HTTP_404_NOT_FOUND """
         logging.info(f"Id da eliminare: {9999999}")